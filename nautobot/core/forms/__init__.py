@@ -1,79 +1,84 @@
-from nautobot.core.forms.constants import (
-    ALPHANUMERIC_EXPANSION_PATTERN,
-    BOOLEAN_CHOICES,
-    BOOLEAN_WITH_BLANK_CHOICES,
-    IP4_EXPANSION_PATTERN,
-    IP6_EXPANSION_PATTERN,
-    NUMERIC_EXPANSION_PATTERN,
-)
-from nautobot.core.forms.fields import (
-    AutoPositionField,
-    AutoPositionPatternField,
-    CommentField,
-    CSVChoiceField,
-    CSVContentTypeField,
-    CSVDataField,
-    CSVFileField,
-    CSVModelChoiceField,
-    CSVMultipleChoiceField,
-    CSVMultipleContentTypeField,
-    DynamicModelChoiceField,
-    DynamicModelMultipleChoiceField,
-    ExpandableIPAddressField,
-    ExpandableNameField,
-    JSONArrayFormField,
-    JSONField,
-    LaxURLField,
-    MACAddressField,
-    MultiMatchModelMultipleChoiceField,
-    MultipleContentTypeField,
-    MultiValueCharField,
-    NullableDateField,
-    NumericArrayField,
-    SlugField,
-    TagFilterField,
-)
-from nautobot.core.forms.forms import (
-    AddressFieldMixin,
-    BootstrapMixin,
-    BulkEditForm,
-    BulkRenameForm,
-    ConfirmationForm,
-    CSVModelForm,
-    DynamicFilterForm,
-    ImportForm,
-    PrefixFieldMixin,
-    ReturnURLForm,
-    TableConfigForm,
-)
-from nautobot.core.forms.search import SearchForm
-from nautobot.core.forms.utils import (
-    add_blank_choice,
-    add_field_to_filter_form_class,
-    expand_alphanumeric_pattern,
-    expand_ipaddress_pattern,
-    form_from_model,
-    parse_alphanumeric_range,
-    parse_numeric_range,
-    restrict_form_fields,
-)
-from nautobot.core.forms.widgets import (
-    APISelect,
-    APISelectMultiple,
-    BulkEditNullBooleanSelect,
-    ColorSelect,
-    ContentTypeSelect,
-    DatePicker,
-    DateTimePicker,
-    MultiValueCharInput,
-    SelectWithDisabled,
-    SelectWithPK,
-    SlugWidget,
-    SmallTextarea,
-    StaticSelect2,
-    StaticSelect2Multiple,
-    TimePicker,
-)
+"""Form classes, fields, and widgets re-exported for use throughout Nautobot.
+
+To keep `import nautobot.core.forms` lightweight, the re-exported names are loaded lazily (PEP 562):
+the submodule defining a given name is only imported when that name is first accessed. This avoids
+paying the cost of importing all of the form/widget machinery in processes (management commands,
+Celery workers, etc.) that never render a form.
+"""
+
+import importlib
+
+_SUBMODULES = ("constants", "fields", "forms", "search", "utils", "widgets")
+
+# Mapping of each re-exported name to the submodule that defines it.
+_LAZY_IMPORTS = {
+    "ALPHANUMERIC_EXPANSION_PATTERN": "nautobot.core.forms.constants",
+    "BOOLEAN_CHOICES": "nautobot.core.forms.constants",
+    "BOOLEAN_WITH_BLANK_CHOICES": "nautobot.core.forms.constants",
+    "IP4_EXPANSION_PATTERN": "nautobot.core.forms.constants",
+    "IP6_EXPANSION_PATTERN": "nautobot.core.forms.constants",
+    "NUMERIC_EXPANSION_PATTERN": "nautobot.core.forms.constants",
+    "AutoPositionField": "nautobot.core.forms.fields",
+    "AutoPositionPatternField": "nautobot.core.forms.fields",
+    "CommentField": "nautobot.core.forms.fields",
+    "CSVChoiceField": "nautobot.core.forms.fields",
+    "CSVContentTypeField": "nautobot.core.forms.fields",
+    "CSVDataField": "nautobot.core.forms.fields",
+    "CSVFileField": "nautobot.core.forms.fields",
+    "CSVModelChoiceField": "nautobot.core.forms.fields",
+    "CSVMultipleChoiceField": "nautobot.core.forms.fields",
+    "CSVMultipleContentTypeField": "nautobot.core.forms.fields",
+    "DynamicModelChoiceField": "nautobot.core.forms.fields",
+    "DynamicModelMultipleChoiceField": "nautobot.core.forms.fields",
+    "ExpandableIPAddressField": "nautobot.core.forms.fields",
+    "ExpandableNameField": "nautobot.core.forms.fields",
+    "JSONArrayFormField": "nautobot.core.forms.fields",
+    "JSONField": "nautobot.core.forms.fields",
+    "LaxURLField": "nautobot.core.forms.fields",
+    "MACAddressField": "nautobot.core.forms.fields",
+    "MultiMatchModelMultipleChoiceField": "nautobot.core.forms.fields",
+    "MultipleContentTypeField": "nautobot.core.forms.fields",
+    "MultiValueCharField": "nautobot.core.forms.fields",
+    "NullableDateField": "nautobot.core.forms.fields",
+    "NumericArrayField": "nautobot.core.forms.fields",
+    "SlugField": "nautobot.core.forms.fields",
+    "TagFilterField": "nautobot.core.forms.fields",
+    "AddressFieldMixin": "nautobot.core.forms.forms",
+    "BootstrapMixin": "nautobot.core.forms.forms",
+    "BulkEditForm": "nautobot.core.forms.forms",
+    "BulkRenameForm": "nautobot.core.forms.forms",
+    "ConfirmationForm": "nautobot.core.forms.forms",
+    "CSVModelForm": "nautobot.core.forms.forms",
+    "DynamicFilterForm": "nautobot.core.forms.forms",
+    "ImportForm": "nautobot.core.forms.forms",
+    "PrefixFieldMixin": "nautobot.core.forms.forms",
+    "ReturnURLForm": "nautobot.core.forms.forms",
+    "TableConfigForm": "nautobot.core.forms.forms",
+    "SearchForm": "nautobot.core.forms.search",
+    "add_blank_choice": "nautobot.core.forms.utils",
+    "add_field_to_filter_form_class": "nautobot.core.forms.utils",
+    "expand_alphanumeric_pattern": "nautobot.core.forms.utils",
+    "expand_ipaddress_pattern": "nautobot.core.forms.utils",
+    "form_from_model": "nautobot.core.forms.utils",
+    "parse_alphanumeric_range": "nautobot.core.forms.utils",
+    "parse_numeric_range": "nautobot.core.forms.utils",
+    "restrict_form_fields": "nautobot.core.forms.utils",
+    "APISelect": "nautobot.core.forms.widgets",
+    "APISelectMultiple": "nautobot.core.forms.widgets",
+    "BulkEditNullBooleanSelect": "nautobot.core.forms.widgets",
+    "ColorSelect": "nautobot.core.forms.widgets",
+    "ContentTypeSelect": "nautobot.core.forms.widgets",
+    "DatePicker": "nautobot.core.forms.widgets",
+    "DateTimePicker": "nautobot.core.forms.widgets",
+    "MultiValueCharInput": "nautobot.core.forms.widgets",
+    "SelectWithDisabled": "nautobot.core.forms.widgets",
+    "SelectWithPK": "nautobot.core.forms.widgets",
+    "SlugWidget": "nautobot.core.forms.widgets",
+    "SmallTextarea": "nautobot.core.forms.widgets",
+    "StaticSelect2": "nautobot.core.forms.widgets",
+    "StaticSelect2Multiple": "nautobot.core.forms.widgets",
+    "TimePicker": "nautobot.core.forms.widgets",
+}
 
 __all__ = (
     "ALPHANUMERIC_EXPANSION_PATTERN",
@@ -143,3 +148,20 @@ __all__ = (
     "parse_numeric_range",
     "restrict_form_fields",
 )
+
+
+def __getattr__(name):
+    module_path = _LAZY_IMPORTS.get(name)
+    if module_path is not None:
+        value = getattr(importlib.import_module(module_path), name)
+    elif name in _SUBMODULES:
+        value = importlib.import_module(f"{__name__}.{name}")
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    # Cache on the package so that subsequent accesses bypass __getattr__ entirely.
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__) | set(_SUBMODULES))
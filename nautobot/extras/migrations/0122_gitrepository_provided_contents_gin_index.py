@@ -0,0 +1,26 @@
+from django.db import migrations
+
+
+def create_gin_index(apps, schema_editor):
+    """Add a GIN index so that `provided_contents` containment lookups can be served by an index probe."""
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    schema_editor.execute(
+        "CREATE INDEX IF NOT EXISTS gitrepo_contents_gin ON extras_gitrepository USING gin (provided_contents);"
+    )
+
+
+def drop_gin_index(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    schema_editor.execute("DROP INDEX IF EXISTS gitrepo_contents_gin;")
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("extras", "0121_alter_team_contacts"),
+    ]
+
+    operations = [
+        migrations.RunPython(create_gin_index, drop_gin_index),
+    ]
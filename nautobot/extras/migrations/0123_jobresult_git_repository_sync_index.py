@@ -0,0 +1,39 @@
+from django.db import migrations
+
+
+def create_index(apps, schema_editor):
+    """
+    Add a functional index serving GitRepository sync lookups against JobResult.
+
+    `GitRepository.get_latest_sync()` and `latest_syncs_for()` filter on the `repository` key of
+    `task_kwargs` plus a `task_name` prefix and sort by `date_created`; without an index this is a
+    sequential scan over the whole JobResult table. Django compiles the key lookup to the jsonb
+    extraction `("task_kwargs" -> 'repository')`, so the index is built on that expression (not the
+    `->>` text extraction, which would never match). The `date_created DESC` key column lets
+    `.latest()` resolve via a backward index scan.
+    """
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    schema_editor.execute(
+        "CREATE INDEX CONCURRENTLY IF NOT EXISTS jobresult_repo_idx "
+        "ON extras_jobresult ((task_kwargs -> 'repository'), task_name, date_created DESC);"
+    )
+
+
+def drop_index(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    schema_editor.execute("DROP INDEX IF EXISTS jobresult_repo_idx;")
+
+
+class Migration(migrations.Migration):
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction.
+    atomic = False
+
+    dependencies = [
+        ("extras", "0122_gitrepository_provided_contents_gin_index"),
+    ]
+
+    operations = [
+        migrations.RunPython(create_index, drop_index),
+    ]
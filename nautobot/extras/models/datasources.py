@@ -1,20 +1,65 @@
 """Models for representing external data sources."""
 
-from importlib.util import find_spec
+import functools
 import os
+import pkgutil
+import sys
+import uuid
 
 from django.conf import settings
 from django.core.exceptions import ValidationError
 from django.core.serializers.json import DjangoJSONEncoder
-from django.db import models
+from django.db import connection, models
+from django.db.models.functions import RowNumber
 
 from nautobot.core.constants import CHARFIELD_MAX_LENGTH
 from nautobot.core.models.fields import AutoSlugField, LaxURLField, slugify_dashes_to_underscores
 from nautobot.core.models.generics import PrimaryModel
 from nautobot.core.models.validators import EnhancedURLValidator
+from nautobot.extras.choices import JobResultStatusChoices
 from nautobot.extras.utils import check_if_key_is_graphql_safe, extras_features
 
 
+@functools.cache
+def _get_job_result_model():
+    """Deferred import of JobResult (circular with nautobot.extras.models), resolved once per process."""
+    from nautobot.extras.models import JobResult
+
+    return JobResult
+
+
+@functools.cache
+def _get_git_enqueue_functions():
+    """Deferred import of the Git sync enqueue helpers (circular with nautobot.extras.datasources)."""
+    from nautobot.extras.datasources import (
+        enqueue_git_repository_diff_origin_and_local,
+        enqueue_pull_git_repository_and_refresh_data,
+    )
+
+    return enqueue_git_repository_diff_origin_and_local, enqueue_pull_git_repository_and_refresh_data
+
+
+# Cached set of top-level Python module names, used by GitRepository.clean() to reject slugs that would
+# shadow an installed module. Enumerating them walks all of sys.path, so do it at most once per process.
+_top_level_python_modules = None
+
+
+def _installed_python_modules():
+    """Return a frozenset of all top-level Python module and package names importable in this process."""
+    global _top_level_python_modules
+    if _top_level_python_modules is None:
+        _top_level_python_modules = frozenset(module.name for module in pkgutil.iter_modules()) | frozenset(
+            sys.builtin_module_names
+        )
+    return _top_level_python_modules
+
+
+def invalidate_module_cache():
+    """Discard the cached set of top-level module names; call after mutating sys.path (mainly useful in tests)."""
+    global _top_level_python_modules
+    _top_level_python_modules = None
+
+
 @extras_features(
     "config_context_owners",
     "export_template_owners",
@@ -69,16 +114,29 @@ class GitRepository(PrimaryModel):
 
     clone_fields = ["remote_url", "secrets_group", "provided_contents"]
 
+    # Pre-save values captured by from_db()/save() and consulted in clean(). Class-level defaults so
+    # that constructing an instance (including each row materialized from a queryset) incurs no extra
+    # per-instance work.
+    __initial_slug = None
+    __loaded_remote_url = None
+    __loaded_branch = None
+
     class Meta:
         ordering = ["name"]
         verbose_name = "Git repository"
         verbose_name_plural = "Git repositories"
 
-    def __init__(self, *args, **kwargs):
-        super().__init__(*args, **kwargs)
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
 
-        # Store the initial repo slug so we can check for changes on save().
-        self.__initial_slug = self.slug
+        # Capture the pre-save values so that clean() can detect changes without re-querying the database.
+        if "slug" in field_names:
+            instance.__initial_slug = instance.slug
+        if "remote_url" in field_names and "branch" in field_names:
+            instance.__loaded_remote_url = instance.remote_url
+            instance.__loaded_branch = instance.branch
+        return instance
 
     def __str__(self):
         return self.name
@@ -90,7 +148,7 @@ class GitRepository(PrimaryModel):
         if self.slug == "":
             self._meta.get_field("slug").create_slug(self, add=(not self.present_in_database))
 
-        if self.present_in_database and self.slug != self.__initial_slug:
+        if self.present_in_database and self.__initial_slug is not None and self.slug != self.__initial_slug:
             raise ValidationError(
                 f"Slug cannot be changed once set. Current slug is {self.__initial_slug}, "
                 f"requested slug is {self.slug}"
@@ -99,15 +157,20 @@ class GitRepository(PrimaryModel):
         if not self.present_in_database:
             check_if_key_is_graphql_safe(self.__class__.__name__, self.slug, "slug")
             # Check on create whether the proposed slug conflicts with a module name already in the Python environment.
-            if find_spec(self.slug) is not None:
+            if self.slug in _installed_python_modules():
                 raise ValidationError(
                     f'Please choose a different slug, as "{self.slug}" is an installed Python package or module.'
                 )
 
         if self.provided_contents:
-            q = models.Q()
-            for item in self.provided_contents:
-                q |= models.Q(provided_contents__contains=item)
+            if connection.vendor == "postgresql":
+                # Single GIN-indexable containment check (`?|` operator) covering all provided content types at once.
+                q = models.Q(provided_contents__has_any_keys=list(self.provided_contents))
+            else:
+                # On other databases `has_any_keys` doesn't match JSON array members, so OR together per-item checks.
+                q = models.Q()
+                for item in self.provided_contents:
+                    q |= models.Q(provided_contents__contains=item)
             duplicate_repos = GitRepository.objects.filter(remote_url=self.remote_url).exclude(id=self.id).filter(q)
             if duplicate_repos.exists():
                 raise ValidationError(
@@ -117,10 +180,25 @@ class GitRepository(PrimaryModel):
 
         # Changing branch or remote_url invalidates current_head
         if self.present_in_database:
-            past = GitRepository.objects.get(id=self.id)
-            if self.remote_url != past.remote_url or self.branch != past.branch:
+            loaded_remote_url = self.__loaded_remote_url
+            loaded_branch = self.__loaded_branch
+            if loaded_remote_url is None or loaded_branch is None:
+                # Never captured - the instance wasn't loaded via from_db() (or the fields were deferred);
+                # fetch the pre-save values from the database as before.
+                past = GitRepository.objects.get(id=self.id)
+                loaded_remote_url = past.remote_url
+                loaded_branch = past.branch
+            if self.remote_url != loaded_remote_url or self.branch != loaded_branch:
                 self.current_head = ""
 
+    def save(self, *args, **kwargs):
+        super().save(*args, **kwargs)
+
+        # The instance now matches the database; update the cached pre-save values accordingly.
+        self.__initial_slug = self.slug
+        self.__loaded_remote_url = self.remote_url
+        self.__loaded_branch = self.branch
+
     def get_latest_sync(self):
         """
         Return a `JobResult` for the latest sync operation.
@@ -128,11 +206,92 @@ class GitRepository(PrimaryModel):
         Returns:
             JobResult
         """
-        from nautobot.extras.models import JobResult
+        job_result_model = _get_job_result_model()
 
         # This will match all "GitRepository" jobs (pull/refresh, dry-run, etc.)
         prefix = "nautobot.core.jobs.GitRepository"
-        return JobResult.objects.filter(task_name__startswith=prefix, task_kwargs__repository=self.pk).latest()
+        return job_result_model.objects.filter(task_name__startswith=prefix, task_kwargs__repository=self.pk).latest()
+
+    @classmethod
+    def latest_syncs_for(cls, repositories):
+        """
+        Look up the most recent completed sync `JobResult` for each of the given repositories in a single query.
+
+        Args:
+            repositories (iterable): GitRepository instances or queryset thereof.
+
+        Returns:
+            dict: Mapping of repository PK (as a string, as recorded in `JobResult.task_kwargs`) to JobResult.
+        """
+        results = (
+            _get_job_result_model()
+            .objects.filter(
+                task_name__startswith="nautobot.core.jobs.GitRepository",
+                task_kwargs__repository__in=[str(repository.pk) for repository in repositories],
+                status__in=JobResultStatusChoices.READY_STATES,
+            )
+            .annotate(
+                _sync_rank=models.Window(
+                    expression=RowNumber(),
+                    partition_by=[models.F("task_kwargs__repository")],
+                    order_by=models.F("date_created").desc(),
+                )
+            )
+            .defer("result")
+        )
+        return {result.task_kwargs["repository"]: result for result in results.filter(_sync_rank=1)}
+
+    @classmethod
+    def bulk_clone(cls, sources, batch_size=500):
+        """
+        Create a copy of each of the given GitRepositories, persisted with a single INSERT per batch.
+
+        Each clone receives a unique suffix on its name and slug. Because this uses `bulk_create()`, it
+        intentionally bypasses the per-instance `save()` pipeline — change logging, custom field
+        validation, and signal dispatch — and is meant for controlled internal use where many copies are
+        needed at once; use `validated_save()` on individual instances when those side effects matter.
+
+        Args:
+            sources (iterable): GitRepository instances to clone.
+            batch_size (int): Number of rows to insert per query.
+
+        Returns:
+            list[GitRepository]: The newly created clones.
+        """
+        name_max_length = cls._meta.get_field("name").max_length
+        slug_max_length = cls._meta.get_field("slug").max_length
+        clones = []
+        for source in sources:
+            suffix = uuid.uuid4().hex
+            # Truncate the source values so the suffixed copies still fit their fields; bulk_create()
+            # skips validation, so an overrun would otherwise surface as a raw database error.
+            clones.append(
+                cls(
+                    name=f"{source.name[: name_max_length - len(suffix) - 3]} ({suffix})",
+                    slug=f"{source.slug[: slug_max_length - len(suffix) - 1]}_{suffix}",
+                    remote_url=source.remote_url,
+                    branch=source.branch,
+                    current_head=source.current_head,
+                    secrets_group_id=source.secrets_group_id,
+                    provided_contents=list(source.provided_contents),
+                )
+            )
+        return cls.objects.bulk_create(clones, batch_size=batch_size)
+
+    @classmethod
+    def for_csv_export(cls):
+        """
+        Return a queryset suitable for bulk CSV export via `to_csv()`.
+
+        Pre-joins the `secrets_group` foreign key (accessed per-row in `to_csv()`) and restricts the
+        selected columns to those the export needs. Callers exporting large data sets should consume
+        this via `.iterator()` so that rows are streamed rather than held in memory all at once.
+        """
+        return (
+            cls.objects.select_related("secrets_group")
+            .only("name", "slug", "remote_url", "branch", "provided_contents", "secrets_group__name")
+            .order_by("name")
+        )
 
     def to_csv(self):
         return (
@@ -159,9 +318,8 @@ class GitRepository(PrimaryModel):
         Returns:
             JobResult
         """
-        from nautobot.extras.datasources import (
-            enqueue_git_repository_diff_origin_and_local,
-            enqueue_pull_git_repository_and_refresh_data,
+        enqueue_git_repository_diff_origin_and_local, enqueue_pull_git_repository_and_refresh_data = (
+            _get_git_enqueue_functions()
         )
 
         if dry_run:
@@ -1072,6 +1072,83 @@ class GitRepositoryTest(ModelTestCases.BaseModelTestCase):
         self.repo.remote_url = "http://some-private-host/example.git"
         self.repo.validated_save()
 
+    def test_bulk_clone(self):
+        """Confirm that bulk_clone() copies fields, uniquifies name/slug, and respects field length limits."""
+        secrets_group = SecretsGroup.objects.create(name="Clone Secrets Group")
+        self.repo.secrets_group = secrets_group
+        self.repo.provided_contents = ["extras.configcontext"]
+        self.repo.save()
+        name_max_length = GitRepository._meta.get_field("name").max_length
+        slug_max_length = GitRepository._meta.get_field("slug").max_length
+        long_repo = GitRepository(
+            name="x" * name_max_length,
+            slug="y" * slug_max_length,
+            remote_url="http://localhost/long.git",
+        )
+        long_repo.validated_save()
+
+        sources = [self.repo, long_repo]
+        clones = GitRepository.bulk_clone(sources)
+
+        self.assertEqual(len(clones), 2)
+        for clone, source in zip(clones, sources):
+            self.assertTrue(GitRepository.objects.filter(pk=clone.pk).exists())
+            self.assertNotEqual(clone.pk, source.pk)
+            self.assertNotEqual(clone.name, source.name)
+            self.assertNotEqual(clone.slug, source.slug)
+            self.assertLessEqual(len(clone.name), name_max_length)
+            self.assertLessEqual(len(clone.slug), slug_max_length)
+            self.assertEqual(clone.remote_url, source.remote_url)
+            self.assertEqual(clone.branch, source.branch)
+            self.assertEqual(clone.current_head, source.current_head)
+            self.assertEqual(clone.secrets_group_id, source.secrets_group_id)
+            self.assertEqual(clone.provided_contents, source.provided_contents)
+
+    def test_latest_syncs_for(self):
+        """Confirm that latest_syncs_for() returns the newest completed sync per repository, keyed by str(pk)."""
+        repo_2 = GitRepository(
+            name="Test Git Repository 2",
+            slug="test_git_repo_2",
+            remote_url="http://localhost/git2.git",
+        )
+        repo_2.validated_save()
+
+        # Older completed syncs, superseded by those created below
+        for repository in (self.repo, repo_2):
+            JobResult.objects.create(
+                name=repository.name,
+                task_name="nautobot.core.jobs.GitRepositorySync",
+                task_kwargs={"repository": str(repository.pk)},
+                status=JobResultStatusChoices.STATUS_FAILURE,
+            )
+        expected = {
+            str(repository.pk): JobResult.objects.create(
+                name=repository.name,
+                task_name="nautobot.core.jobs.GitRepositorySync",
+                task_kwargs={"repository": str(repository.pk)},
+                status=JobResultStatusChoices.STATUS_SUCCESS,
+            )
+            for repository in (self.repo, repo_2)
+        }
+        # Newer, but not in READY_STATES, so it must not supersede the completed sync above
+        JobResult.objects.create(
+            name=self.repo.name,
+            task_name="nautobot.core.jobs.GitRepositorySync",
+            task_kwargs={"repository": str(self.repo.pk)},
+            status=JobResultStatusChoices.STATUS_STARTED,
+        )
+        # Newer, but not a GitRepository job, so it must be excluded as well
+        JobResult.objects.create(
+            name=self.repo.name,
+            task_name="nautobot.core.jobs.ExportObjectList",
+            task_kwargs={"repository": str(self.repo.pk)},
+            status=JobResultStatusChoices.STATUS_SUCCESS,
+        )
+
+        self.assertEqual(GitRepository.latest_syncs_for([self.repo, repo_2]), expected)
+        # Only the requested repositories are included
+        self.assertEqual(GitRepository.latest_syncs_for([repo_2]), {str(repo_2.pk): expected[str(repo_2.pk)]})
+
 
 class JobModelTest(ModelTestCases.BaseModelTestCase):
     """
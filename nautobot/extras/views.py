@@ -79,7 +79,6 @@ from .choices import (
     DynamicGroupTypeChoices,
     JobExecutionType,
     JobQueueTypeChoices,
-    JobResultStatusChoices,
     LogLevelChoices,
 )
 from .datasources import (
@@ -1022,19 +1021,9 @@ class GitRepositoryListView(generic.ObjectListView):
     template_name = "extras/gitrepository_list.html"
 
     def extra_context(self):
-        # Get the newest results for each repository name
-        results = {
-            r.task_kwargs["repository"]: r
-            for r in JobResult.objects.filter(
-                task_name__startswith="nautobot.core.jobs.GitRepository",
-                task_kwargs__repository__isnull=False,
-                status__in=JobResultStatusChoices.READY_STATES,
-            )
-            .order_by("date_done")
-            .defer("result")
-        }
+        # Get the newest result for each repository in the (filtered) queryset, in a single query
         return {
-            "job_results": results,
+            "job_results": GitRepository.latest_syncs_for(self.queryset),
             "datasource_contents": get_datasource_contents("extras.gitrepository"),
         }
 